@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Synthetic Dataset Generator for Smart Timetable & Attendance System
+Generates deterministic, seeded CSV data at configurable scale for performance testing
+"""
+
+import argparse
+import csv
+import os
+import random
+import time
+from array import array
+from datetime import date, datetime, timedelta
+
+DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']
+
+# 9 AM to 5 PM with the 12:00-13:00 lunch break left free
+SLOTS = [
+    '09:00-10:00', '10:00-11:00', '11:00-12:00',
+    '13:00-14:00', '14:00-15:00', '15:00-16:00', '16:00-17:00'
+]
+
+DEPARTMENT_NAMES = [
+    'Computer Science', 'Mathematics', 'Physics', 'Electronics',
+    'Mechanical Engineering', 'Civil Engineering', 'Chemistry', 'Biotechnology'
+]
+
+SUBJECT_NAMES = [
+    'Distributed Systems', 'Linear Algebra', 'Numerical Methods', 'DBMS',
+    'Probability', 'Data Structures', 'Algorithms', 'Operating Systems',
+    'Computer Networks', 'Discrete Mathematics', 'Machine Learning',
+    'Digital Logic', 'Signals and Systems', 'Thermodynamics', 'Mechanics',
+    'Organic Chemistry', 'Statistics', 'Compiler Design'
+]
+
+FIRST_NAMES = [
+    'Rowan', 'Harper', 'Parker', 'Quinn', 'Alex', 'Taylor', 'Casey', 'Jordan',
+    'Morgan', 'Riley', 'Avery', 'Jamie', 'Skyler', 'Reese', 'Dakota', 'Emerson'
+]
+
+LAST_NAMES = [
+    'Williams', 'Jones', 'Davis', 'Smith', 'Chen', 'Wilson', 'Anderson',
+    'Johnson', 'Brown', 'Garcia', 'Miller', 'Martin', 'Lee', 'Walker'
+]
+
+ROOM_CAPACITIES = [25, 30, 35, 40, 45, 60]
+
+# Fixed default so runs are reproducible for the same seed
+DEFAULT_START_DATE = date(2024, 1, 8)
+
+OUTPUT_FILES = [
+    'rooms.csv', 'subjects.csv', 'teachers.csv', 'students.csv',
+    'timetable.csv', 'attendance_auto.csv'
+]
+
+
+class SyntheticDataGenerator:
+    def __init__(self, output_dir: str, departments: int = 4, sections: int = 3,
+                 students: int = 1200, weeks: int = 16, subjects_per_department: int = 8,
+                 teachers_per_department: int = 12, rooms: int = 40,
+                 start_date: date = None, seed: int = 42):
+        self.output_dir = output_dir
+        self.departments = [
+            DEPARTMENT_NAMES[i] if i < len(DEPARTMENT_NAMES) else f'Department {i + 1}'
+            for i in range(departments)
+        ]
+        self.sections = [self._section_name(i) for i in range(sections)]
+        self.num_students = students
+        self.weeks = weeks
+        self.subjects_per_department = subjects_per_department
+        self.teachers_per_department = max(teachers_per_department, sections)
+        self.num_rooms = max(rooms, departments * sections)
+        self.start_date = self._next_monday(start_date or DEFAULT_START_DATE)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        self.subjects = {}  # department -> [subject_id]
+        self.teachers = {}  # department -> [teacher_id]
+        self.rooms = []     # [(room_id, capacity)]
+        self.students = {}  # (department, section) -> (first student index, count)
+        self.student_rates = array('f')
+        self.timetable = {}  # (department, section) -> {day: [(slot, subject, teacher, room)]}
+
+    @staticmethod
+    def _section_name(index: int) -> str:
+        name = ''
+        index += 1
+        while index:
+            index, remainder = divmod(index - 1, 26)
+            name = chr(ord('A') + remainder) + name
+        return name
+
+    @staticmethod
+    def _next_monday(day: date) -> date:
+        return day + timedelta(days=(7 - day.weekday()) % 7)
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.output_dir, filename)
+
+    def _person_name(self) -> str:
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    def _popular_choice(self, items: list, skew: float = 1.2):
+        """Pick an item with Zipf-like skew towards the front of the list"""
+        weights = [1 / (rank + 1) ** skew for rank in range(len(items))]
+        return self.rng.choices(items, weights=weights)[0]
+
+    def generate_rooms(self):
+        """Generate rooms.csv"""
+        with open(self._path('rooms.csv'), 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['room_id', 'capacity'])
+            for i in range(self.num_rooms):
+                room = (f'R{i + 1:03d}', self.rng.choice(ROOM_CAPACITIES))
+                self.rooms.append(room)
+                writer.writerow(room)
+
+    def generate_subjects(self):
+        """Generate subjects.csv"""
+        with open(self._path('subjects.csv'), 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['subject_id', 'name', 'department'])
+            counter = 0
+            for department in self.departments:
+                names = self.rng.sample(SUBJECT_NAMES, min(len(SUBJECT_NAMES), self.subjects_per_department))
+                while len(names) < self.subjects_per_department:
+                    names.append(f'{self.rng.choice(SUBJECT_NAMES)} {len(names) // len(SUBJECT_NAMES) + 1}')
+                self.subjects[department] = []
+                for name in names:
+                    counter += 1
+                    subject_id = f'S{counter:04d}'
+                    self.subjects[department].append(subject_id)
+                    writer.writerow([subject_id, name, department])
+
+    def generate_teachers(self):
+        """Generate teachers.csv"""
+        with open(self._path('teachers.csv'), 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['teacher_id', 'name', 'department'])
+            counter = 0
+            for department in self.departments:
+                self.teachers[department] = []
+                for _ in range(self.teachers_per_department):
+                    counter += 1
+                    teacher_id = f'T{counter:04d}'
+                    self.teachers[department].append(teacher_id)
+                    writer.writerow([teacher_id, self._person_name(), department])
+
+    def generate_students(self):
+        """Generate students.csv, spreading students evenly over all sections"""
+        groups = [(d, s) for d in self.departments for s in self.sections]
+        base, extra = divmod(self.num_students, len(groups))
+
+        with open(self._path('students.csv'), 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['student_id', 'name', 'department', 'section', 'email', 'parent_email'])
+            index = 0
+            for group_number, (department, section) in enumerate(groups):
+                count = base + (1 if group_number < extra else 0)
+                self.students[(department, section)] = (index, count)
+                for _ in range(count):
+                    index += 1
+                    student_id = f'ST{index:03d}'
+                    writer.writerow([
+                        student_id, self._person_name(), department, section,
+                        f'{student_id.lower()}@university.edu',
+                        f'parent.{student_id.lower()}@example.com'
+                    ])
+                    # Per-student attendance propensity, most students attend reliably
+                    self.student_rates.append(self.rng.betavariate(9, 1.5))
+
+    def generate_timetable(self):
+        """Generate a clash-free timetable.csv with popular rooms used more often"""
+        room_capacity = dict(self.rooms)
+        room_ids = [room_id for room_id, _ in self.rooms]
+
+        with open(self._path('timetable.csv'), 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['department', 'section', 'day', 'slot', 'subject_id',
+                             'teacher_id', 'room_id', 'room_capacity'])
+            for day in DAYS:
+                for slot in SLOTS:
+                    busy_rooms = set()
+                    busy_teachers = set()
+                    for department in self.departments:
+                        for section in self.sections:
+                            subject_id = self.rng.choice(self.subjects[department])
+                            teacher_id = self.rng.choice(
+                                [t for t in self.teachers[department] if t not in busy_teachers])
+                            room_id = self._popular_choice(
+                                [r for r in room_ids if r not in busy_rooms])
+                            busy_teachers.add(teacher_id)
+                            busy_rooms.add(room_id)
+
+                            schedule = self.timetable.setdefault((department, section), {})
+                            schedule.setdefault(day, []).append((slot, subject_id, teacher_id, room_id))
+                            writer.writerow([department, section, day, slot, subject_id,
+                                             teacher_id, room_id, room_capacity[room_id]])
+
+    def _absence_factor(self, day: str, slot: str, week: int) -> float:
+        """Multiplier on attendance propensity for realistic temporal skew"""
+        factor = 1.0
+        if day == 'Mon' and slot in SLOTS[:2]:
+            factor *= 0.85  # Monday-morning absences
+        if day == 'Fri' and slot in SLOTS[-2:]:
+            factor *= 0.9   # Friday-afternoon drop-off
+        if slot == SLOTS[3]:
+            factor *= 0.95  # Right after lunch
+        # Attendance slowly declines over the term
+        factor *= 1.0 - 0.1 * week / max(1, self.weeks)
+        return factor
+
+    def generate_attendance(self, progress_every: int = 1_000_000) -> int:
+        """Stream attendance_auto.csv day by day without holding rows in memory"""
+        rows = 0
+        next_progress = progress_every
+        rates = self.student_rates
+        random_value = self.rng.random
+
+        with open(self._path('attendance_auto.csv'), 'w', newline='', buffering=1024 * 1024) as f:
+            writer = csv.writer(f)
+            writer.writerow(['date', 'day', 'slot', 'student_id', 'department', 'section',
+                             'subject_id', 'teacher_id', 'room_id', 'status'])
+            for week in range(self.weeks):
+                for day_index, day in enumerate(DAYS):
+                    class_date = (self.start_date + timedelta(weeks=week, days=day_index)).isoformat()
+                    for (department, section), (first, count) in self.students.items():
+                        for slot, subject_id, teacher_id, room_id in self.timetable[(department, section)][day]:
+                            factor = self._absence_factor(day, slot, week)
+                            writer.writerows(
+                                (class_date, day, slot, f'ST{index + 1:03d}', department, section,
+                                 subject_id, teacher_id, room_id,
+                                 'present' if random_value() < rates[index] * factor else 'absent')
+                                for index in range(first, first + count)
+                            )
+                            rows += count
+                            if rows >= next_progress:
+                                print(f"   ... {rows:,} attendance rows written")
+                                next_progress += progress_every
+        return rows
+
+    def generate_all(self):
+        """Generate every CSV file in dependency order"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        started = time.time()
+
+        print(f"📁 Writing synthetic data to: {self.output_dir} (seed {self.seed})")
+        self.generate_rooms()
+        print(f"✅ rooms.csv: {len(self.rooms)} rooms")
+        self.generate_subjects()
+        print(f"✅ subjects.csv: {sum(len(s) for s in self.subjects.values())} subjects")
+        self.generate_teachers()
+        print(f"✅ teachers.csv: {sum(len(t) for t in self.teachers.values())} teachers")
+        self.generate_students()
+        print(f"✅ students.csv: {self.num_students} students")
+        self.generate_timetable()
+        print(f"✅ timetable.csv: {len(self.timetable)} sections × {len(DAYS) * len(SLOTS)} classes")
+        rows = self.generate_attendance()
+        print(f"✅ attendance_auto.csv: {rows:,} rows over {self.weeks} weeks")
+
+        print(f"\n⏱️ Completed in {time.time() - started:.1f}s")
+
+
+def positive_int(value: str) -> int:
+    """argparse type for scale knobs, which must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not an integer")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic CSV data for performance testing")
+    parser.add_argument('--output-dir', default='synthetic-data',
+                        help='Directory for the generated CSV files (default: synthetic-data)')
+    parser.add_argument('--force', action='store_true',
+                        help='Overwrite CSV files that already exist in the output directory')
+    parser.add_argument('--departments', type=positive_int, default=4)
+    parser.add_argument('--sections', type=positive_int, default=3, help='Sections per department')
+    parser.add_argument('--students', type=positive_int, default=1200, help='Total number of students')
+    parser.add_argument('--weeks', type=positive_int, default=16, help='Term length in weeks')
+    parser.add_argument('--subjects-per-department', type=positive_int, default=8)
+    parser.add_argument('--teachers-per-department', type=positive_int, default=12)
+    parser.add_argument('--rooms', type=positive_int, default=40)
+    parser.add_argument('--start-date', type=lambda value: datetime.strptime(value, '%Y-%m-%d').date(),
+                        default=None, help='First Monday of the term (YYYY-MM-DD)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    existing = [name for name in OUTPUT_FILES if os.path.exists(os.path.join(args.output_dir, name))]
+    if existing and not args.force:
+        parser.error(f"{', '.join(existing)} already exist in {args.output_dir}; "
+                     f"pass --force to overwrite them")
+
+    print("🚀 Starting Synthetic Data Generation...")
+    generator = SyntheticDataGenerator(
+        output_dir=args.output_dir,
+        departments=args.departments,
+        sections=args.sections,
+        students=args.students,
+        weeks=args.weeks,
+        subjects_per_department=args.subjects_per_department,
+        teachers_per_department=args.teachers_per_department,
+        rooms=args.rooms,
+        start_date=args.start_date,
+        seed=args.seed
+    )
+    generator.generate_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for the Smart Timetable & Attendance test harnesses
+Keep-alive connection pooling, concurrent service probing and per-request timing breakdowns
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Connect time of the current request, recorded per thread by the pooled connections
+_connect_timing = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _connect_timing.value = (time.perf_counter() - started) * 1000
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        _connect_timing.value = (time.perf_counter() - started) * 1000
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool
+        }
+
+
+class HarnessClient:
+    """Pooled HTTP client that records connect/TTFB/transfer timings for every request.
+
+    Each response gets a ``timing`` dict in milliseconds. A connect time of 0
+    means the request reused a kept-alive connection.
+    """
+
+    def __init__(self, pool_size: int = 20, timeout: float = 10, keep_timings: bool = True):
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.keep_timings = keep_timings
+        self.timings = []
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = _TimedHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request on a pooled connection and attach its timing breakdown"""
+        kwargs.setdefault('timeout', self.timeout)
+        _connect_timing.value = 0.0
+
+        started = time.perf_counter()
+        response = self.session.request(method, url, stream=True, **kwargs)
+        headers_at = time.perf_counter()
+        response.content  # Read the body so transfer time is measured separately
+        finished = time.perf_counter()
+
+        connect = _connect_timing.value
+        response.timing = {
+            'connect': connect,
+            'ttfb': max(0.0, (headers_at - started) * 1000 - connect),
+            'transfer': (finished - headers_at) * 1000,
+            'total': (finished - started) * 1000
+        }
+        if self.keep_timings:
+            with self._lock:
+                self.timings.append({
+                    'method': method,
+                    'url': url,
+                    'status': response.status_code,
+                    **response.timing
+                })
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    async def gather(self, calls: dict) -> dict:
+        """Run several requests concurrently.
+
+        ``calls`` maps a name to ``(method, url, kwargs)``. Returns a dict of the
+        same names mapped to a response or the exception that was raised.
+        """
+        loop = asyncio.get_running_loop()
+        names = list(calls.keys())
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(len(names), self.pool_size))) as executor:
+            futures = [
+                loop.run_in_executor(executor, lambda c=calls[name]: self.request(c[0], c[1], **c[2]))
+                for name in names
+            ]
+            results = await asyncio.gather(*futures, return_exceptions=True)
+        return dict(zip(names, results))
+
+    def probe_all(self, urls: dict, path: str = '', **kwargs) -> dict:
+        """GET every service URL concurrently and return name -> response or exception"""
+        calls = {name: ('GET', f"{url}{path}", kwargs) for name, url in urls.items()}
+        return asyncio.run(self.gather(calls))
+
+    def timing_summary(self) -> dict:
+        """Average timing breakdown over all recorded requests"""
+        with self._lock:
+            timings = list(self.timings)
+        if not timings:
+            return {}
+        return {
+            'requests': len(timings),
+            'reused_connections': sum(1 for t in timings if t['connect'] == 0),
+            **{
+                f'avg_{key}': sum(t[key] for t in timings) / len(timings)
+                for key in ('connect', 'ttfb', 'transfer', 'total')
+            }
+        }
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def format_timing(timing: dict) -> str:
+    """Format a timing breakdown for log messages"""
+    return (f"connect {timing['connect']:.1f}ms, TTFB {timing['ttfb']:.1f}ms, "
+            f"transfer {timing['transfer']:.1f}ms")
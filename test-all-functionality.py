@@ -9,6 +9,7 @@ import json
 import time
 import sys
 from datetime import datetime
+from harness_client import HarnessClient, format_timing
 
 class SystemTester:
     def __init__(self):
@@ -19,6 +20,7 @@ class SystemTester:
             'chatbot': 'http://localhost:3001'
         }
         self.results = []
+        self.client = HarnessClient()
         
     def log_test(self, test_name, status, message=""):
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -39,15 +41,17 @@ class SystemTester:
         """Test if all services are running and healthy"""
         print("\n🔍 Testing Service Health...")
         
+        # Probe all services concurrently
+        responses = self.client.probe_all(self.base_urls, '/health', timeout=5)
         for service, url in self.base_urls.items():
-            try:
-                response = requests.get(f"{url}/health", timeout=5)
-                if response.status_code == 200:
-                    self.log_test(f"{service.upper()} Health Check", "PASS", f"Service running on {url}")
-                else:
-                    self.log_test(f"{service.upper()} Health Check", "FAIL", f"Status: {response.status_code}")
-            except requests.exceptions.RequestException as e:
-                self.log_test(f"{service.upper()} Health Check", "FAIL", f"Connection error: {str(e)}")
+            response = responses[service]
+            if isinstance(response, Exception):
+                self.log_test(f"{service.upper()} Health Check", "FAIL", f"Connection error: {str(response)}")
+            elif response.status_code == 200:
+                self.log_test(f"{service.upper()} Health Check", "PASS",
+                              f"Service running on {url} ({format_timing(response.timing)})")
+            else:
+                self.log_test(f"{service.upper()} Health Check", "FAIL", f"Status: {response.status_code}")
     
     def test_backend_endpoints(self):
         """Test backend API endpoints"""
@@ -55,7 +59,7 @@ class SystemTester:
         
         # Test main endpoint
         try:
-            response = requests.get(f"{self.base_urls['backend']}/", timeout=5)
+            response = self.client.get(f"{self.base_urls['backend']}/", timeout=5)
             if response.status_code == 200:
                 self.log_test("Backend Main Endpoint", "PASS", "Service responding")
             else:
@@ -65,7 +69,7 @@ class SystemTester:
         
         # Test chatbot endpoint
         try:
-            response = requests.post(
+            response = self.client.post(
                 f"{self.base_urls['backend']}/api/chatbot/chat",
                 json={"message": "Hello", "context": "test"},
                 timeout=10
@@ -87,7 +91,7 @@ class SystemTester:
         
         # Test departments endpoint
         try:
-            response = requests.get(f"{self.base_urls['ml_service']}/api/departments", timeout=10)
+            response = self.client.get(f"{self.base_urls['ml_service']}/api/departments", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if isinstance(data, list):
@@ -101,7 +105,7 @@ class SystemTester:
         
         # Test chatbot context endpoint
         try:
-            response = requests.get(f"{self.base_urls['ml_service']}/api/chatbot/context", timeout=10)
+            response = self.client.get(f"{self.base_urls['ml_service']}/api/chatbot/context", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if 'data_sources' in data:
@@ -115,7 +119,7 @@ class SystemTester:
         
         # Test ML chatbot endpoint
         try:
-            response = requests.post(
+            response = self.client.post(
                 f"{self.base_urls['ml_service']}/api/chat",
                 json={"query": "What is the attendance rate?", "context": "timetable_attendance_system"},
                 timeout=15
@@ -147,7 +151,7 @@ class SystemTester:
         
         for path, name in pages:
             try:
-                response = requests.get(f"{self.base_urls['frontend']}{path}", timeout=10)
+                response = self.client.get(f"{self.base_urls['frontend']}{path}", timeout=10)
                 if response.status_code == 200:
                     self.log_test(f"Frontend {name}", "PASS", f"Page accessible at {path}")
                 else:
@@ -161,7 +165,7 @@ class SystemTester:
         
         # Test ML service RAG first
         try:
-            response = requests.post(
+            response = self.client.post(
                 f"{self.base_urls['ml_service']}/api/chat",
                 json={"query": "Show me attendance data", "context": "timetable_attendance_system"},
                 timeout=15
@@ -179,7 +183,7 @@ class SystemTester:
         
         # Test backend fallback
         try:
-            response = requests.post(
+            response = self.client.post(
                 f"{self.base_urls['backend']}/api/chatbot/chat",
                 json={"message": "How can I improve attendance?", "context": "TimeTracker support"},
                 timeout=10
@@ -201,7 +205,7 @@ class SystemTester:
         
         # Test that external links are properly configured
         try:
-            response = requests.get(f"{self.base_urls['frontend']}/", timeout=10)
+            response = self.client.get(f"{self.base_urls['frontend']}/", timeout=10)
             if response.status_code == 200:
                 content = response.text
                 
@@ -281,7 +285,8 @@ class SystemTester:
                 'warnings': warning_tests,
                 'success_rate': (passed_tests/total_tests*100) if total_tests > 0 else 0
             },
-            'results': self.results
+            'results': self.results,
+            'timings': self.client.timing_summary()
         }
         
         with open('test_report.json', 'w') as f:
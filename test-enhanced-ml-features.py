@@ -4,11 +4,11 @@ Comprehensive Test Script for Enhanced ML Features
 Tests timetable optimization, attendance prediction, and notification alerts
 """
 
-import requests
 import json
 import os
 import time
 from datetime import datetime
+from harness_client import HarnessClient
 
 class EnhancedMLTester:
     def __init__(self):
@@ -18,6 +18,7 @@ class EnhancedMLTester:
             'backend': 'http://localhost:4000'
         }
         self.results = []
+        self.client = HarnessClient(timeout=30)
         
     def log_test(self, test_name, status, message=""):
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -40,7 +41,7 @@ class EnhancedMLTester:
         
         try:
             # Test timetable optimization endpoint
-            response = requests.post(
+            response = self.client.post(
                 f"{self.base_urls['ml_service']}/api/optimize-timetable",
                 timeout=30
             )
@@ -73,7 +74,7 @@ class EnhancedMLTester:
         
         try:
             # Test attendance prediction endpoint
-            response = requests.post(
+            response = self.client.post(
                 f"{self.base_urls['ml_service']}/api/predict-attendance",
                 params={'days_ahead': 30},
                 timeout=30
@@ -107,7 +108,7 @@ class EnhancedMLTester:
         
         try:
             # Test notification endpoint
-            response = requests.post(
+            response = self.client.post(
                 f"{self.base_urls['ml_service']}/api/send-notifications",
                 params={'notification_type': 'high'},
                 timeout=30
@@ -131,7 +132,7 @@ class EnhancedMLTester:
         
         try:
             # Test risk summary endpoint
-            response = requests.get(
+            response = self.client.get(
                 f"{self.base_urls['ml_service']}/api/risk-summary",
                 timeout=30
             )
@@ -150,7 +151,7 @@ class EnhancedMLTester:
         
         try:
             # Test individual student attendance status
-            response = requests.get(
+            response = self.client.get(
                 f"{self.base_urls['ml_service']}/api/attendance-status/ST001",
                 timeout=30
             )
@@ -175,7 +176,7 @@ class EnhancedMLTester:
         
         # Test routine image generation
         try:
-            response = requests.post(
+            response = self.client.post(
                 f"{self.base_urls['ml_service']}/api/chat",
                 json={
                     "query": "What's my today's routine?",
@@ -198,7 +199,7 @@ class EnhancedMLTester:
         
         # Test attendance queries
         try:
-            response = requests.post(
+            response = self.client.post(
                 f"{self.base_urls['ml_service']}/api/chat",
                 json={
                     "query": "What is my attendance status?",
@@ -244,7 +245,7 @@ class EnhancedMLTester:
         
         try:
             # Test that chatbot can access ML-generated data
-            response = requests.get(
+            response = self.client.get(
                 f"{self.base_urls['ml_service']}/api/chatbot/context",
                 timeout=30
             )
@@ -320,7 +321,8 @@ class EnhancedMLTester:
                 'warnings': warning_tests,
                 'success_rate': (passed_tests/total_tests*100) if total_tests > 0 else 0
             },
-            'results': self.results
+            'results': self.results,
+            'timings': self.client.timing_summary()
         }
         
         with open('enhanced_ml_test_report.json', 'w') as f:
@@ -9,6 +9,7 @@ import json
 import time
 import sys
 from typing import Dict, List
+from harness_client import HarnessClient, format_timing
 
 class IntegrationTester:
     def __init__(self):
@@ -19,20 +20,18 @@ class IntegrationTester:
             'chatbot': 'http://localhost:3001'
         }
         self.results = {}
+        self.client = HarnessClient()
 
-    def test_service_health(self, service_name: str, url: str) -> bool:
-        """Test if a service is responding"""
-        try:
-            response = requests.get(f"{url}/health", timeout=5)
-            if response.status_code == 200:
-                print(f"✅ {service_name} is healthy")
-                return True
-            else:
-                print(f"❌ {service_name} returned status {response.status_code}")
-                return False
-        except requests.exceptions.RequestException as e:
-            print(f"❌ {service_name} is not responding: {e}")
+    def _check_health(self, service_name: str, response) -> bool:
+        """Report a health probe result (a response or the raised exception)"""
+        if isinstance(response, Exception):
+            print(f"❌ {service_name} is not responding: {response}")
             return False
+        if response.status_code == 200:
+            print(f"✅ {service_name} is healthy ({format_timing(response.timing)})")
+            return True
+        print(f"❌ {service_name} returned status {response.status_code}")
+        return False
 
     def test_ml_service_endpoints(self) -> Dict:
         """Test ML service specific endpoints"""
@@ -41,7 +40,7 @@ class IntegrationTester:
         
         # Test departments endpoint
         try:
-            response = requests.get(f"{base_url}/api/departments")
+            response = self.client.get(f"{base_url}/api/departments", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 results['departments'] = len(data.get('departments', []))
@@ -55,7 +54,7 @@ class IntegrationTester:
 
         # Test chatbot context endpoint
         try:
-            response = requests.get(f"{base_url}/api/chatbot/context")
+            response = self.client.get(f"{base_url}/api/chatbot/context", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 results['chatbot_context'] = len(data.get('available_data', []))
@@ -73,7 +72,7 @@ class IntegrationTester:
                 "query": "What is the attendance rate?",
                 "context": "timetable_attendance_system"
             }
-            response = requests.post(f"{base_url}/api/chat", json=chat_payload)
+            response = self.client.post(f"{base_url}/api/chat", json=chat_payload, timeout=15)
             if response.status_code == 200:
                 data = response.json()
                 results['chat_response'] = len(data.get('response', '')) > 0
@@ -94,7 +93,7 @@ class IntegrationTester:
         
         # Test health endpoint
         try:
-            response = requests.get(f"{base_url}/health")
+            response = self.client.get(f"{base_url}/health", timeout=5)
             if response.status_code == 200:
                 results['health'] = True
                 print(f"✅ Backend: Health check passed")
@@ -110,7 +109,7 @@ class IntegrationTester:
     def test_chatbot_service(self) -> bool:
         """Test chatbot service"""
         try:
-            response = requests.get(f"{self.base_urls['chatbot']}/", timeout=5)
+            response = self.client.get(f"{self.base_urls['chatbot']}/", timeout=5)
             if response.status_code == 200:
                 print(f"✅ Chatbot: Service responding")
                 return True
@@ -126,10 +125,11 @@ class IntegrationTester:
         print("🚀 Starting Integration Tests...")
         print("=" * 50)
 
-        # Test service health
-        for service_name, url in self.base_urls.items():
-            if service_name != 'frontend':  # Skip frontend for now
-                self.results[f"{service_name}_health"] = self.test_service_health(service_name, url)
+        # Test service health, probing all services concurrently
+        services = {name: url for name, url in self.base_urls.items() if name != 'frontend'}  # Skip frontend for now
+        responses = self.client.probe_all(services, '/health', timeout=5)
+        for service_name in services:
+            self.results[f"{service_name}_health"] = self._check_health(service_name, responses[service_name])
 
         print("\n" + "=" * 50)
         print("Testing ML Service Endpoints...")